@@ -91,8 +91,9 @@ export default function ChecklistsPage() {
   // ============================================================================
   const categories = Array.from(new Set(checklists.map(c => c.category).filter(Boolean)));
   
+  const needle = searchQuery.toLowerCase();
   const filteredChecklists = checklists.filter(checklist => {
-    const matchesSearch = checklist.name.toLowerCase().includes(searchQuery.toLowerCase());
+    const matchesSearch = checklist.name.toLowerCase().includes(needle);
     const matchesCategory = selectedCategory === "all" || checklist.category === selectedCategory;
     return matchesSearch && matchesCategory;
   });
@@ -146,8 +146,9 @@ export default function RewardsPage() {
 
   // filtered view
   const filtered = useMemo(()=>{
+    const needle = q.trim().toLowerCase();
     return grants.filter(g=>{
-      const matchesQ = q.trim() ? (g.title.toLowerCase().includes(q.trim().toLowerCase()) || (g.note||"").toLowerCase().includes(q.trim().toLowerCase())) : true;
+      const matchesQ = needle ? (g.title.toLowerCase().includes(needle) || (g.note||"").toLowerCase().includes(needle)) : true;
       const matchesG = gfilter==="all" ? true : g.deltas.some(d=>d.group_id===gfilter);
       return matchesQ && matchesG;
     }).sort((a,b)=> (b.granted_at.localeCompare(a.granted_at)));
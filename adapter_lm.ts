@@ -24,61 +24,67 @@ function normalizeBase(u: string | undefined): string {
   return String(u || DEFAULT_BASE).replace(/\/+$/, "");
 }
 
+const WHEN_TO_ACT = [
+  `Use a tool when the user asks to create/update data (e.g., "make a task", "add to checklist", "save today's journal").`,
+  `Do NOT call a tool for questions, summaries, or planning text—just reply normally.`,
+  `If any required arg is missing, ask a brief follow-up instead of guessing.`,
+].join(" ");
+
+const OUTPUT_RULES = [
+  `When you decide to act, emit exactly ONE line of JSON (no prose) with this shape:`,
+  `{"type":"toolcall","name":"<tool-name>","args":{...}}`,
+  `No trailing commentary before or after that line.`,
+].join("\n");
+
+const FEW_SHOT = [
+  `# Examples (GOOD)`,
+  `User: "Add a checklist item 'Take vitamins' to Morning Routine (id 5)"`,
+  `Assistant: {"type":"toolcall","name":"checklists.addItem","args":{"checklist_id":5,"text":"Take vitamins"}}`,
+  ``,
+  `User: "Create a low priority task: Mop kitchen"`,
+  `Assistant: {"type":"toolcall","name":"tasks.create","args":{"title":"Mop kitchen","priority":5}}`,
+  ``,
+  `User: "Log: felt tired, mood 3/10, energy 2/10, stress 7/10, tags: sick, cold"`,
+  `Assistant: {"type":"toolcall","name":"journal.save","args":{"text":"felt tired","mood":3,"energy":2,"stress":7,"tags":"sick,cold"}}`,
+  ``,
+  `# Examples (NO TOOL)`,
+  `User: "Summarize my tasks and suggest a plan"`,
+  `Assistant: (plain text summary + plan; no toolcall)`,
+].join("\n");
+
+// Everything between the role line and the context block is the same for
+// every request, so build it (including the tool registry text) once.
+let promptBody: string | null = null;
+
+function getPromptBody(): string {
+  if (promptBody === null) {
+    promptBody = [
+      ``,
+      `# Available Tools`,
+      generateToolRegistry(),
+      ``,
+      `# When to Use Tools`,
+      WHEN_TO_ACT,
+      ``,
+      `# Output Format`,
+      OUTPUT_RULES,
+      ``,
+      FEW_SHOT,
+    ].join("\n");
+  }
+  return promptBody;
+}
+
 /** Role-aware prompt builder with toolcall protocol & examples. */
 export function buildSystemPrompt(agent: string, context?: string): string {
   const role = (agent || "Assistant").trim();
   const ctx  = (context && context.trim()) ? `\n\n### Context\n${context.trim()}` : "";
 
-  // Import tool registry from centralized tools module
-  const registry = generateToolRegistry();
-
-  const whenToAct = [
-    `Use a tool when the user asks to create/update data (e.g., "make a task", "add to checklist", "save today's journal").`,
-    `Do NOT call a tool for questions, summaries, or planning text—just reply normally.`,
-    `If any required arg is missing, ask a brief follow-up instead of guessing.`,
-  ].join(" ");
-
-  const outputRules = [
-    `When you decide to act, emit exactly ONE line of JSON (no prose) with this shape:`,
-    `{"type":"toolcall","name":"<tool-name>","args":{...}}`,
-    `No trailing commentary before or after that line.`,
-  ].join("\n");
-
-  const fewShot = [
-    `# Examples (GOOD)`,
-    `User: "Add a checklist item 'Take vitamins' to Morning Routine (id 5)"`,
-    `Assistant: {"type":"toolcall","name":"checklists.addItem","args":{"checklist_id":5,"text":"Take vitamins"}}`,
-    ``,
-    `User: "Create a low priority task: Mop kitchen"`,
-    `Assistant: {"type":"toolcall","name":"tasks.create","args":{"title":"Mop kitchen","priority":5}}`,
-    ``,
-    `User: "Log: felt tired, mood 3/10, energy 2/10, stress 7/10, tags: sick, cold"`,
-    `Assistant: {"type":"toolcall","name":"journal.save","args":{"text":"felt tired","mood":3,"energy":2,"stress":7,"tags":"sick,cold"}}`,
-    ``,
-    `# Examples (NO TOOL)`,
-    `User: "Summarize my tasks and suggest a plan"`,
-    `Assistant: (plain text summary + plan; no toolcall)`,
-  ].join("\n");
-
   const roleTone = role === "Kraken"
     ? `You are Kraken: bold, tactical, but still concise and compliant with the rules below.`
     : `You are ${role}: a concise, helpful copilot for a personal productivity app.`;
 
-  return [
-    roleTone,
-    ``,
-    `# Available Tools`,
-    registry,
-    ``,
-    `# When to Use Tools`,
-    whenToAct,
-    ``,
-    `# Output Format`,
-    outputRules,
-    ``,
-    fewShot,
-    ctx,
-  ].join("\n");
+  return roleTone + "\n" + getPromptBody() + "\n" + ctx;
 }
 
 /** Single completion */
@@ -7,5 +7,9 @@ const SCHEMA_PATH = "./schema.sql";
 const sql = fs.readFileSync(SCHEMA_PATH, "utf8");
 const db = new Database(DB_PATH);
 db.exec("PRAGMA journal_mode=WAL;");
+db.exec("PRAGMA synchronous=NORMAL;");
 db.exec(sql);
+// Fold the WAL back into the main file so the server starts from a clean log
+db.pragma("wal_checkpoint(TRUNCATE)");
+db.close();
 console.log("Schema applied to", DB_PATH);
@@ -336,12 +336,23 @@ export function getRecurringTemplates(): ChecklistTemplate[] {
   return CHECKLIST_TEMPLATES.filter(template => template.recurring);
 }
 
+// Lowercased searchable text per template, built once on first search.
+// Fields are joined with NUL so a query can't match across field boundaries.
+let templateSearchKeys: string[] | null = null;
+
+function getTemplateSearchKeys(): string[] {
+  if (!templateSearchKeys) {
+    templateSearchKeys = CHECKLIST_TEMPLATES.map(template =>
+      [template.name, template.description, template.category, ...template.items.map(item => item.text)]
+        .join('\0')
+        .toLowerCase()
+    );
+  }
+  return templateSearchKeys;
+}
+
 export function searchTemplates(query: string): ChecklistTemplate[] {
   const lowercaseQuery = query.toLowerCase();
-  return CHECKLIST_TEMPLATES.filter(template => 
-    template.name.toLowerCase().includes(lowercaseQuery) ||
-    template.description.toLowerCase().includes(lowercaseQuery) ||
-    template.category.toLowerCase().includes(lowercaseQuery) ||
-    template.items.some(item => item.text.toLowerCase().includes(lowercaseQuery))
-  );
+  const keys = getTemplateSearchKeys();
+  return CHECKLIST_TEMPLATES.filter((_, i) => keys[i].includes(lowercaseQuery));
 }
\ No newline at end of file
@@ -2,8 +2,16 @@
 const db = new Database("./app.db");
 function cols(t){ return db.prepare(`PRAGMA table_info(${t})`).all().map(x=>x.name); }
 function cnt(t){ return db.prepare(`SELECT COUNT(*) c FROM ${t}`).get().c; }
-function safe(t){ try { return { cols: cols(t), count: cnt(t) }; } catch(e){ return { error: String(e) }; } }
+// All row counts in one round-trip; null (any failure) falls back to per-table cnt()
+function countAll(ts){
+  try {
+    const sql = ts.map(t => `SELECT '${t}' AS t, (SELECT COUNT(*) FROM "${t}") AS c`).join(" UNION ALL ");
+    return Object.fromEntries(db.prepare(sql).all().map(r => [r.t, r.c]));
+  } catch(e){ return null; }
+}
 const tables = ["tasks","checklists","checklist_items"];
+const counts = countAll(tables);
+function safe(t){ try { return { cols: cols(t), count: counts ? counts[t] : cnt(t) }; } catch(e){ return { error: String(e) }; } }
 for (const t of tables) {
   const info = safe(t);
   console.log(`TABLE ${t}:`, JSON.stringify(info));
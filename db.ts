@@ -2,6 +2,7 @@
 import Database from 'better-sqlite3';
 import { drizzle } from 'drizzle-orm/better-sqlite3';
 import { schema } from './schema.js';
+import { tuneConnection } from './sqlite_tuning.js';
 
 // ============================================================================
 // DATABASE CONNECTION
@@ -11,6 +12,7 @@ import { schema } from './schema.js';
 const sqlite = new Database('./app.db');
 sqlite.pragma('journal_mode = WAL');
 sqlite.pragma('foreign_keys = ON');
+tuneConnection(sqlite);
 
 // Create Drizzle ORM instance
 export const db = drizzle(sqlite, { schema });
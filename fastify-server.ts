@@ -7,7 +7,8 @@ import Database from 'better-sqlite3';
 import * as fs from 'fs';
 import * as path from 'path';
 import { logEvent, getEvents } from './trace.js';
-import { executeTool } from './tools.js';
+import { executeTool, initializeTools } from './tools.js';
+import { tuneConnection } from './sqlite_tuning.js';
 
 // Initialize Fastify
 const fastify = Fastify({
@@ -23,6 +24,24 @@ const fastify = Fastify({
 const db = new Database('./app.db');
 db.pragma('journal_mode = WAL');
 db.pragma('foreign_keys = ON');
+tuneConnection(db);
+
+// Share this connection with the tool executors rather than opening a second one
+initializeTools(db);
+
+// Prepared statements keyed by SQL text. Handlers build SQL from a fixed set of
+// fragments with values bound as parameters, so the cache stays small and each
+// distinct query is compiled once instead of on every request.
+const statementCache = new Map<string, Database.Statement>();
+
+function prepareCached(sql: string): Database.Statement {
+  let stmt = statementCache.get(sql);
+  if (!stmt) {
+    stmt = db.prepare(sql);
+    statementCache.set(sql, stmt);
+  }
+  return stmt;
+}
 
 const PORT = process.env.PORT ? parseInt(process.env.PORT) : 8002;
 
@@ -166,7 +185,7 @@ fastify.get('/api/tasks', {
         sql += " ORDER BY priority DESC, created_at DESC";
     }
 
-    const stmt = db.prepare(sql);
+    const stmt = prepareCached(sql);
     const tasks = stmt.all(...params);
     
     return tasks;
@@ -186,7 +205,7 @@ fastify.post('/api/tasks', {
   try {
     const { title, description, priority = 2, xp = 0, coins = 0, category_id, due_date, due_time } = request.body as any;
 
-    const stmt = db.prepare(`
+    const stmt = prepareCached(`
       INSERT INTO tasks (title, description, priority, xp_reward, coin_reward, category_id, due_date, due_time, created_at, is_active)
       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
     `);
@@ -249,8 +268,10 @@ fastify.patch('/api/tasks/:id', {
     const setClauses: string[] = [];
     const values: any[] = [];
 
-    for (const [key, value] of Object.entries(updates)) {
-      if (allowedFields.includes(key) && value !== undefined) {
+    // Walk allowedFields (not the body) so column order, and thus the cached SQL, is stable
+    for (const key of allowedFields) {
+      const value = updates[key];
+      if (value !== undefined) {
         setClauses.push(`${key} = ?`);
         values.push(value);
       }
@@ -261,7 +282,7 @@ fastify.patch('/api/tasks/:id', {
     }
 
     values.push(id);
-    const stmt = db.prepare(`UPDATE tasks SET ${setClauses.join(", ")} WHERE task_id = ? AND is_active = 1`);
+    const stmt = prepareCached(`UPDATE tasks SET ${setClauses.join(", ")} WHERE task_id = ? AND is_active = 1`);
     const result = stmt.run(...values);
 
     if (result.changes === 0) {
@@ -293,7 +314,7 @@ fastify.delete('/api/tasks/:id', {
   try {
     const { id } = request.params as any;
 
-    const stmt = db.prepare("UPDATE tasks SET is_active = 0 WHERE task_id = ? AND is_active = 1");
+    const stmt = prepareCached("UPDATE tasks SET is_active = 0 WHERE task_id = ? AND is_active = 1");
     const result = stmt.run(id);
 
     if (result.changes === 0) {
@@ -337,7 +358,7 @@ fastify.post('/api/tasks/:id/complete', {
     const { note } = request.body as any;
 
     // Get task details first
-    const taskStmt = db.prepare("SELECT * FROM tasks WHERE task_id = ? AND is_active = 1");
+    const taskStmt = prepareCached("SELECT * FROM tasks WHERE task_id = ? AND is_active = 1");
     const task = taskStmt.get(id);
 
     if (!task) {
@@ -345,7 +366,7 @@ fastify.post('/api/tasks/:id/complete', {
     }
 
     // Create completion record
-    const completionStmt = db.prepare(`
+    const completionStmt = prepareCached(`
       INSERT INTO task_completions (task_id, xp_earned, coins_earned, note, completed_at)
       VALUES (?, ?, ?, ?, ?)
     `);
@@ -359,7 +380,7 @@ fastify.post('/api/tasks/:id/complete', {
     );
 
     // Soft delete the task
-    const deleteStmt = db.prepare("UPDATE tasks SET is_active = 0 WHERE task_id = ?");
+    const deleteStmt = prepareCached("UPDATE tasks SET is_active = 0 WHERE task_id = ?");
     deleteStmt.run(id);
 
     logEvent("task_completed", { 
@@ -401,25 +422,34 @@ fastify.get('/api/checklists', {
   try {
     const { category } = request.query as any;
     
-    let sql = "SELECT * FROM checklists WHERE 1=1";
+    let where = " WHERE 1=1";
     const params: any[] = [];
 
     if (category?.trim()) {
-      sql += " AND category = ?";
+      where += " AND category = ?";
       params.push(category.trim());
     }
 
-    sql += " ORDER BY created_at DESC";
-
-    const stmt = db.prepare(sql);
+    const stmt = prepareCached(`SELECT * FROM checklists${where} ORDER BY created_at DESC`);
     const checklists = stmt.all(...params);
 
-    // Get items for each checklist
-    const itemsStmt = db.prepare("SELECT * FROM checklist_items WHERE checklist_id = ? ORDER BY position ASC, item_id ASC");
+    // Fetch items for all matched checklists in one query and group them here,
+    // instead of issuing one items query per checklist
+    const itemsStmt = prepareCached(`
+      SELECT * FROM checklist_items
+      WHERE checklist_id IN (SELECT checklist_id FROM checklists${where})
+      ORDER BY position ASC, item_id ASC
+    `);
+    const itemsByChecklist = new Map<number, any[]>();
+    for (const item of itemsStmt.all(...params) as any[]) {
+      const bucket = itemsByChecklist.get(item.checklist_id);
+      if (bucket) bucket.push(item);
+      else itemsByChecklist.set(item.checklist_id, [item]);
+    }
     
     const result = checklists.map(checklist => ({
       ...checklist,
-      items: itemsStmt.all((checklist as any).checklist_id)
+      items: itemsByChecklist.get((checklist as any).checklist_id) || []
     }));
 
     return result;
@@ -438,7 +468,7 @@ fastify.post('/api/checklists', {
   try {
     const { name, category } = request.body as any;
 
-    const stmt = db.prepare(`
+    const stmt = prepareCached(`
       INSERT INTO checklists (name, category, created_at)
       VALUES (?, ?, ?)
     `);
@@ -476,7 +506,7 @@ fastify.post('/api/checklists/:id/items', {
     const { id: checklistId } = request.params as any;
     const { text, position = 0 } = request.body as any;
 
-    const stmt = db.prepare(`
+    const stmt = prepareCached(`
       INSERT INTO checklist_items (checklist_id, text, position, completed, created_at)
       VALUES (?, ?, ?, 0, ?)
     `);
@@ -529,8 +559,10 @@ fastify.patch('/api/checklists/items/:id', {
     const setClauses: string[] = [];
     const values: any[] = [];
 
-    for (const [key, value] of Object.entries(updates)) {
-      if (allowedFields.includes(key) && value !== undefined) {
+    // Walk allowedFields (not the body) so column order, and thus the cached SQL, is stable
+    for (const key of allowedFields) {
+      const value = updates[key];
+      if (value !== undefined) {
         setClauses.push(`${key} = ?`);
         values.push(value);
       }
@@ -541,7 +573,7 @@ fastify.patch('/api/checklists/items/:id', {
     }
 
     values.push(itemId);
-    const stmt = db.prepare(`UPDATE checklist_items SET ${setClauses.join(", ")} WHERE item_id = ?`);
+    const stmt = prepareCached(`UPDATE checklist_items SET ${setClauses.join(", ")} WHERE item_id = ?`);
     const result = stmt.run(...values);
 
     if (result.changes === 0) {
@@ -571,7 +603,7 @@ fastify.post('/api/journal', {
   try {
     const { text, mood, energy, stress, tags } = request.body as any;
 
-    const stmt = db.prepare(`
+    const stmt = prepareCached(`
       INSERT INTO journal_entries (text, mood, energy, stress, tags, created_at)
       VALUES (?, ?, ?, ?, ?, ?)
     `);
@@ -631,7 +663,7 @@ fastify.get('/api/journal/recent', {
 
     sql += " ORDER BY created_at DESC LIMIT 100";
 
-    const stmt = db.prepare(sql);
+    const stmt = prepareCached(sql);
     const rows = stmt.all(...params);
     
     return { rows };
@@ -799,7 +831,7 @@ fastify.get('/api/admin/export/tasks', {
   try {
     const { format } = request.query as any;
     
-    const stmt = db.prepare(`
+    const stmt = prepareCached(`
       SELECT task_id, title, description, priority, xp_reward, coin_reward, category_id, created_at, due_date, due_time
       FROM tasks 
       WHERE is_active = 1 
@@ -839,7 +871,7 @@ fastify.get('/api/admin/export/journal', {
   try {
     const { format } = request.query as any;
     
-    const stmt = db.prepare("SELECT * FROM journal_entries ORDER BY created_at DESC");
+    const stmt = prepareCached("SELECT * FROM journal_entries ORDER BY created_at DESC");
     const entries = stmt.all();
     
     if (format === "csv") {
@@ -907,10 +939,13 @@ fastify.get('/api/admin/health', async (request, reply) => {
       wal: db.pragma('journal_mode', { simple: true }) === 'wal'
     };
 
-    // Get some basic counts
-    const taskCount = db.prepare("SELECT COUNT(*) as count FROM tasks WHERE is_active = 1").get() as any;
-    const journalCount = db.prepare("SELECT COUNT(*) as count FROM journal_entries").get() as any;
-    const checklistCount = db.prepare("SELECT COUNT(*) as count FROM checklists").get() as any;
+    // Get some basic counts (one statement instead of a round-trip per table)
+    const counts = prepareCached(`
+      SELECT
+        (SELECT COUNT(*) FROM tasks WHERE is_active = 1) AS tasks,
+        (SELECT COUNT(*) FROM journal_entries) AS journal,
+        (SELECT COUNT(*) FROM checklists) AS checklists
+    `).get() as any;
 
     return { 
       status: "ok", 
@@ -920,9 +955,9 @@ fastify.get('/api/admin/health', async (request, reply) => {
       server: "fastify-esm-fixed",
       db: dbInfo,
       counts: {
-        tasks: taskCount?.count || 0,
-        journal: journalCount?.count || 0,
-        checklists: checklistCount?.count || 0
+        tasks: counts?.tasks || 0,
+        journal: counts?.journal || 0,
+        checklists: counts?.checklists || 0
       }
     };
   } catch (error: any) {
@@ -941,23 +976,23 @@ fastify.get('/api/admin/stats', async (request, reply) => {
   try {
     const stats = {
       tasks: {
-        total: db.prepare("SELECT COUNT(*) as count FROM tasks WHERE is_active = 1").get(),
-        by_priority: db.prepare("SELECT priority, COUNT(*) as count FROM tasks WHERE is_active = 1 GROUP BY priority ORDER BY priority").all(),
-        completed_today: db.prepare("SELECT COUNT(*) as count FROM task_completions WHERE DATE(completed_at) = DATE('now')").get(),
-        total_xp_earned: db.prepare("SELECT SUM(xp_earned) as total FROM task_completions").get(),
-        total_coins_earned: db.prepare("SELECT SUM(coins_earned) as total FROM task_completions").get()
+        total: prepareCached("SELECT COUNT(*) as count FROM tasks WHERE is_active = 1").get(),
+        by_priority: prepareCached("SELECT priority, COUNT(*) as count FROM tasks WHERE is_active = 1 GROUP BY priority ORDER BY priority").all(),
+        completed_today: prepareCached("SELECT COUNT(*) as count FROM task_completions WHERE DATE(completed_at) = DATE('now')").get(),
+        total_xp_earned: prepareCached("SELECT SUM(xp_earned) as total FROM task_completions").get(),
+        total_coins_earned: prepareCached("SELECT SUM(coins_earned) as total FROM task_completions").get()
       },
       journal: {
-        total_entries: db.prepare("SELECT COUNT(*) as count FROM journal_entries").get(),
-        entries_this_week: db.prepare("SELECT COUNT(*) as count FROM journal_entries WHERE created_at >= datetime('now', '-7 days')").get(),
-        avg_mood: db.prepare("SELECT AVG(mood) as avg FROM journal_entries WHERE mood IS NOT NULL").get(),
-        avg_energy: db.prepare("SELECT AVG(energy) as avg FROM journal_entries WHERE energy IS NOT NULL").get(),
-        avg_stress: db.prepare("SELECT AVG(stress) as avg FROM journal_entries WHERE stress IS NOT NULL").get()
+        total_entries: prepareCached("SELECT COUNT(*) as count FROM journal_entries").get(),
+        entries_this_week: prepareCached("SELECT COUNT(*) as count FROM journal_entries WHERE created_at >= datetime('now', '-7 days')").get(),
+        avg_mood: prepareCached("SELECT AVG(mood) as avg FROM journal_entries WHERE mood IS NOT NULL").get(),
+        avg_energy: prepareCached("SELECT AVG(energy) as avg FROM journal_entries WHERE energy IS NOT NULL").get(),
+        avg_stress: prepareCached("SELECT AVG(stress) as avg FROM journal_entries WHERE stress IS NOT NULL").get()
       },
       checklists: {
-        total: db.prepare("SELECT COUNT(*) as count FROM checklists").get(),
-        total_items: db.prepare("SELECT COUNT(*) as count FROM checklist_items").get(),
-        completed_items: db.prepare("SELECT COUNT(*) as count FROM checklist_items WHERE completed = 1").get()
+        total: prepareCached("SELECT COUNT(*) as count FROM checklists").get(),
+        total_items: prepareCached("SELECT COUNT(*) as count FROM checklist_items").get(),
+        completed_items: prepareCached("SELECT COUNT(*) as count FROM checklist_items WHERE completed = 1").get()
       }
     };
 
@@ -993,4 +1028,37 @@ const start = async () => {
   }
 };
 
+// ============================================================================
+// SHUTDOWN
+// ============================================================================
+
+// Refresh planner stats, then close so SQLite checkpoints the WAL into app.db
+function closeDb() {
+  if (!db.open) return;
+  db.pragma('optimize');
+  db.close();
+}
+
+let shuttingDown = false;
+
+const shutdown = async (signal: string) => {
+  if (shuttingDown) return;
+  shuttingDown = true;
+
+  logEvent("fastify_esm_server_stop", { signal });
+  try {
+    await fastify.close();
+  } catch (err) {
+    fastify.log.error(err);
+  }
+  closeDb();
+  process.exit(0);
+};
+
+// Node only emits 'exit' on signals when they are handled, so handle them here
+process.once('SIGINT', () => shutdown('SIGINT'));
+process.once('SIGTERM', () => shutdown('SIGTERM'));
+// Covers explicit process.exit() calls such as a failed listen
+process.once('exit', closeDb);
+
 start();
\ No newline at end of file
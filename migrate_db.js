@@ -1,10 +1,20 @@
 ﻿const Database = require("better-sqlite3");
 const db = new Database("./app.db");
+const colCache = new Map();
 function hasCol(table, name){
-  const cols = db.prepare(`PRAGMA table_info(${table})`).all().map(x=>x.name);
-  return cols.includes(name);
+  if (!colCache.has(table)) {
+    colCache.set(table, new Set(db.prepare(`PRAGMA table_info(${table})`).all().map(x=>x.name)));
+  }
+  return colCache.get(table).has(name);
 }
-db.transaction(()=>{
+
+// user_version is stamped by the schema (the shipped app.db is at 3 and has
+// every column below), so databases at BASE_VERSION or later skip the
+// table_info probes entirely. This script never writes user_version: the
+// backfill covers six columns, not the full schema.
+const BASE_VERSION = 3;
+
+function backfillLegacyColumns(){
   if (!hasCol("checklist_items","position")) {
     db.exec("ALTER TABLE checklist_items ADD COLUMN position INTEGER");
     db.exec(`
@@ -23,5 +33,8 @@ db.transaction(()=>{
   if (!hasCol("tasks","is_active"))   db.exec("ALTER TABLE tasks ADD COLUMN is_active INTEGER DEFAULT 1");
   if (!hasCol("tasks","created_at"))  db.exec("ALTER TABLE tasks ADD COLUMN created_at TEXT");
   if (!hasCol("checklists","created_at")) db.exec("ALTER TABLE checklists ADD COLUMN created_at TEXT");
-})();
+}
+
+const current = db.pragma("user_version", { simple: true });
+if (current < BASE_VERSION) db.transaction(backfillLegacyColumns)();
 console.log("OK");
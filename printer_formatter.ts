@@ -2,24 +2,29 @@
 
 const WIDTH = 40;
 
-function wrapLine(text: string): string[] {
-  const out: string[] = [];
-  let line = "";
+// Appends wrapped lines to `out` (so callers can build one buffer) and returns it
+function wrapLine(text: string, out: string[] = []): string[] {
+  // Collect the current line's words and track its length, joining only at a break
+  let pieces: string[] = [];
+  let lineLen = 0;
   
   for (const word of text.split(/\s+/)) {
-    if (!line.length) { 
-      line = word; 
+    if (!lineLen) { 
+      pieces = [word]; 
+      lineLen = word.length; 
       continue; 
     }
-    if ((line + " " + word).length <= WIDTH) {
-      line += " " + word;
+    if (lineLen + 1 + word.length <= WIDTH) {
+      pieces.push(word);
+      lineLen += 1 + word.length;
     } else { 
-      out.push(line); 
-      line = word; 
+      out.push(pieces.join(" ")); 
+      pieces = [word]; 
+      lineLen = word.length; 
     }
   }
   
-  if (line) out.push(line);
+  if (lineLen) out.push(pieces.join(" "));
   return out;
 }
 
@@ -29,7 +34,7 @@ export function formatChecklist(name: string, items: { text: string; done: 0 | 1
   
   for (const it of items) { 
     const prefix = `- [${it.done ? "x" : " "}] `;
-    lines.push(...wrapLine(prefix + it.text));
+    wrapLine(prefix + it.text, lines);
   }
   
   lines.push("");
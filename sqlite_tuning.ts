@@ -0,0 +1,12 @@
+// FILE: sqlite_tuning.ts - Shared SQLite connection tuning
+import type Database from 'better-sqlite3';
+
+/**
+ * Apply the app's performance pragmas to a connection (call after enabling WAL)
+ */
+export function tuneConnection(conn: Database.Database): void {
+  conn.pragma('synchronous = NORMAL');   // WAL keeps this durable across app crashes
+  conn.pragma('cache_size = -64000');    // ~64MB page cache
+  conn.pragma('mmap_size = 268435456');  // 256MB memory-mapped reads
+  conn.pragma('temp_store = MEMORY');
+}
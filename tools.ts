@@ -1,11 +1,22 @@
 // tools.ts - Centralized tool execution system for AI assistant
 import Database from "better-sqlite3";
 import { capStr, capNum } from "./validate.js";
-
-// Database connection (matches server.ts pattern)
-const db = new Database("./app.db");
-db.pragma("journal_mode = WAL");
-db.pragma("foreign_keys = ON");
+import { tuneConnection } from "./sqlite_tuning.js";
+
+// Database connection (matches server.ts pattern). Opened lazily so the
+// server can share its own connection via initializeTools() instead of this
+// module holding a second connection to the same file.
+let db: Database.Database | null = null;
+
+function getDb(): Database.Database {
+  if (!db) {
+    db = new Database("./app.db");
+    db.pragma("journal_mode = WAL");
+    db.pragma("foreign_keys = ON");
+    tuneConnection(db);
+  }
+  return db;
+}
 
 export function initializeTools(database: Database.Database): void {
   db = database;
@@ -133,7 +144,7 @@ async function executeTasksCreate(args: any): Promise<ToolResult> {
       return { ok: false, error: "Title is required" };
     }
 
-    const stmt = db.prepare(`
+    const stmt = getDb().prepare(`
       INSERT INTO tasks (title, description, priority, category_id, xp_reward, coin_reward, created_at, is_active)
       VALUES (?, ?, ?, ?, ?, ?, ?, 1)
     `);
@@ -161,13 +172,13 @@ async function executeTasksDelete(args: any): Promise<ToolResult> {
     const task_id = capNum(args.task_id, 1, 999999999);
     
     // Check if task exists
-    const task = db.prepare("SELECT task_id, title FROM tasks WHERE task_id = ? AND is_active = 1").get(task_id);
+    const task = getDb().prepare("SELECT task_id, title FROM tasks WHERE task_id = ? AND is_active = 1").get(task_id);
     if (!task) {
       return { ok: false, error: "Task not found or already deleted" };
     }
 
     // Soft delete by setting is_active = 0
-    const stmt = db.prepare("UPDATE tasks SET is_active = 0 WHERE task_id = ?");
+    const stmt = getDb().prepare("UPDATE tasks SET is_active = 0 WHERE task_id = ?");
     const result = stmt.run(task_id);
 
     return {
@@ -196,7 +207,7 @@ async function executeJournalSave(args: any): Promise<ToolResult> {
       return { ok: false, error: "Journal text is required" };
     }
 
-    const stmt = db.prepare(`
+    const stmt = getDb().prepare(`
       INSERT INTO journal_entries (text, mood, energy, stress, tags, created_at)
       VALUES (?, ?, ?, ?, ?, ?)
     `);
@@ -221,13 +232,13 @@ async function executeJournalDelete(args: any): Promise<ToolResult> {
     const entry_id = capNum(args.entry_id, 1, 999999999);
     
     // Check if entry exists
-    const entry = db.prepare("SELECT entry_id FROM journal_entries WHERE entry_id = ?").get(entry_id);
+    const entry = getDb().prepare("SELECT entry_id FROM journal_entries WHERE entry_id = ?").get(entry_id);
     if (!entry) {
       return { ok: false, error: "Journal entry not found" };
     }
 
     // Hard delete journal entries (they're more personal/temporary)
-    const stmt = db.prepare("DELETE FROM journal_entries WHERE entry_id = ?");
+    const stmt = getDb().prepare("DELETE FROM journal_entries WHERE entry_id = ?");
     const result = stmt.run(entry_id);
 
     return {
@@ -254,12 +265,12 @@ async function executeChecklistsAddItem(args: any): Promise<ToolResult> {
     }
 
     // Check if checklist exists
-    const checklist = db.prepare("SELECT checklist_id, name FROM checklists WHERE checklist_id = ?").get(checklist_id);
+    const checklist = getDb().prepare("SELECT checklist_id, name FROM checklists WHERE checklist_id = ?").get(checklist_id);
     if (!checklist) {
       return { ok: false, error: "Checklist not found" };
     }
 
-    const stmt = db.prepare(`
+    const stmt = getDb().prepare(`
       INSERT INTO checklist_items (checklist_id, text, position, completed, created_at)
       VALUES (?, ?, ?, 0, ?)
     `);
@@ -297,13 +308,13 @@ async function executeGymRecordWorkout(args: any): Promise<ToolResult> {
     // For now, we'll store in a generic activities table or create one
     let stmt;
     try {
-      stmt = db.prepare(`
+      stmt = getDb().prepare(`
         INSERT INTO workout_sessions (exercise_type, duration_minutes, intensity, notes, recorded_at)
         VALUES (?, ?, ?, ?, ?)
       `);
     } catch {
       // If workout_sessions table doesn't exist, create it
-      db.exec(`
+      getDb().exec(`
         CREATE TABLE IF NOT EXISTS workout_sessions (
           session_id INTEGER PRIMARY KEY AUTOINCREMENT,
           exercise_type TEXT NOT NULL,
@@ -313,7 +324,7 @@ async function executeGymRecordWorkout(args: any): Promise<ToolResult> {
           recorded_at TEXT NOT NULL
         )
       `);
-      stmt = db.prepare(`
+      stmt = getDb().prepare(`
         INSERT INTO workout_sessions (exercise_type, duration_minutes, intensity, notes, recorded_at)
         VALUES (?, ?, ?, ?, ?)
       `);
@@ -44,6 +44,8 @@ let enabledLevels: Set<string> = new Set(['info', 'warn', 'error', 'debug']);
 
 const eventBuffer: TraceEvent[] = [];
 const pendingTimers: Map<string, { start: number; event: string; data?: any }> = new Map();
+const consoleQueue: TraceEvent[] = [];
+let consoleFlushScheduled = false;
 
 // ============================================================================
 // UTILITY FUNCTIONS
@@ -67,9 +69,7 @@ function trimBuffer(): void {
   }
 }
 
-function logToConsole(event: TraceEvent): void {
-  if (!enableConsoleOutput) return;
-
+function writeToConsole(event: TraceEvent): void {
   const prefix = `[${event.timestamp}] ${event.event}`;
   const message = event.data ? `${prefix}: ${JSON.stringify(event.data)}` : prefix;
 
@@ -88,6 +88,43 @@ function logToConsole(event: TraceEvent): void {
   }
 }
 
+function flushConsole(): void {
+  consoleFlushScheduled = false;
+  const batch = consoleQueue.splice(0, consoleQueue.length);
+  for (const event of batch) {
+    try {
+      writeToConsole(event);
+    } catch {
+      // Unserializable payload (BigInt, circular ref): print the prefix alone
+      // rather than throwing out of a timer and dropping the rest of the batch
+      writeToConsole({ ...event, data: undefined });
+    }
+  }
+}
+
+// Write any still-queued lines when a Node process exits
+if (typeof process !== 'undefined' && typeof process.once === 'function') {
+  process.once('exit', flushConsole);
+}
+
+/**
+ * Queue console output and write it after the current task, so callers
+ * don't pay for JSON.stringify + console I/O inline. Errors flush
+ * immediately (preserving order); anything still queued is flushed on
+ * process exit.
+ */
+function logToConsole(event: TraceEvent): void {
+  if (!enableConsoleOutput) return;
+
+  consoleQueue.push(event);
+  if (event.level === 'error') {
+    flushConsole();
+  } else if (!consoleFlushScheduled) {
+    consoleFlushScheduled = true;
+    setTimeout(flushConsole, 0);
+  }
+}
+
 // ============================================================================
 // CORE LOGGING FUNCTIONS
 // ============================================================================
@@ -118,9 +118,10 @@ export function useChecklistsLogic() {
   }, [checklists]);
 
   const filteredChecklists = useMemo(() => {
+    const needle = searchQuery.toLowerCase();
     let filtered = checklists.filter(checklist => {
-      const matchesSearch = checklist.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-                           checklist.description?.toLowerCase().includes(searchQuery.toLowerCase());
+      const matchesSearch = checklist.name.toLowerCase().includes(needle) ||
+                           checklist.description?.toLowerCase().includes(needle);
       const matchesCategory = selectedCategory === 'all' || checklist.category === selectedCategory;
       return matchesSearch && matchesCategory;
     });
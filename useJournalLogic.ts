@@ -301,9 +301,10 @@ export function useJournalLogic() {
 
   // Filtered entries for display
   const filteredEntries = useMemo(() => {
+    const needle = searchQuery.toLowerCase();
     return entries.filter(entry => {
       // Text search
-      if (searchQuery && !entry.text.toLowerCase().includes(searchQuery.toLowerCase())) {
+      if (needle && !entry.text.toLowerCase().includes(needle)) {
         return false;
       }
 
@@ -61,9 +61,10 @@ export function useTasksLogic() {
 
   // Filter tasks based on current filters - CLIENT SIDE since API doesn't support all filters
   const filteredTasks = useMemo(() => {
+    const needle = taskFilters.search ? taskFilters.search.toLowerCase() : "";
     return tasks.filter(task => {
-      if (taskFilters.search && !task.title.toLowerCase().includes(taskFilters.search.toLowerCase()) 
-          && !task.description?.toLowerCase().includes(taskFilters.search.toLowerCase())) {
+      if (needle && !task.title.toLowerCase().includes(needle) 
+          && !task.description?.toLowerCase().includes(needle)) {
         return false;
       }
       if (taskFilters.priority && task.priority !== parseInt(taskFilters.priority)) {